@@ -15,12 +15,12 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import os
 import shutil
+import tempfile
 from pathlib import Path
 
-import uvicorn
-
 from src.config import (
     AgentSandboxRuntimeConfig,
     CONFIG_ENV_VAR,
@@ -40,6 +40,39 @@ EXAMPLE_FILE_MAP = {
     "k8s-zh": "example.config.k8s.zh.toml",
 }
 
+# Directory holding the packaged example configs (resolved once per process).
+_PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _write_atomic(dest_path: Path, data: bytes) -> None:
+    """
+    Atomically replace ``dest_path`` with ``data``.
+
+    Symlinks are followed so the link target is updated, and an existing file
+    keeps its permission bits; new files get the default mode under the umask.
+    """
+    target = dest_path.resolve()
+    fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp")
+    tmp_path = Path(tmp_name)
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        if target.exists():
+            shutil.copymode(target, tmp_path)
+        else:
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp_path, 0o666 & ~umask)
+        os.replace(tmp_path, target)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
 
 def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
@@ -101,19 +134,38 @@ def copy_example_config(
         raise ValueError(f"Unsupported example kind '{kind}'. Choices: {supported}")
 
     filename = EXAMPLE_FILE_MAP[kind]
-    src_path = Path(__file__).resolve().parent.parent / filename
+    src_path = _PACKAGE_ROOT / filename
     if not src_path.exists():
         raise FileNotFoundError(f"Missing example config template at {src_path}")
 
-    dest_path = Path(destination or DEFAULT_CONFIG_PATH).expanduser()
+    dest_path = Path(destination).expanduser() if destination else DEFAULT_CONFIG_PATH
     dest_path.parent.mkdir(parents=True, exist_ok=True)
     if dest_path.exists() and not force:
         raise FileExistsError(f"Config file already exists at {dest_path}. Use --force to overwrite.")
 
-    shutil.copyfile(src_path, dest_path)
+    _write_atomic(dest_path, src_path.read_bytes())
     return dest_path
 
 
+def _placeholder_for_field(field) -> str:
+    """Return a placeholder TOML value that is intentionally empty."""
+    ann = field.annotation
+    if ann is not None:
+        origin = getattr(ann, "__origin__", None)
+        if ann is list or origin is list:
+            return "[]"
+    return '""'  # string placeholder for scalars/bool/int; user must replace
+
+
+@functools.lru_cache(maxsize=None)
+def _model_schema(model) -> tuple[tuple[str, str | None, str], ...]:
+    """Return ``(key, description, placeholder)`` for each field of a config model."""
+    return tuple(
+        (field.alias or field_name, field.description, _placeholder_for_field(field))
+        for field_name, field in model.model_fields.items()
+    )
+
+
 def render_full_config(destination: str | Path | None = None, *, force: bool = False) -> Path:
     """
     Render the most complete config skeleton from config models with comments.
@@ -123,76 +175,66 @@ def render_full_config(destination: str | Path | None = None, *, force: bool = F
     descriptions to stay in sync with the schema.
     """
 
-    def _placeholder_for_field(field) -> str:
-        """Return a placeholder TOML value that is intentionally empty."""
-        ann = field.annotation
-        if ann is not None:
-            origin = getattr(ann, "__origin__", None)
-            if ann is list or origin is list:
-                return "[]"
-        return '""'  # string placeholder for scalars/bool/int; user must replace
-
-    def _render_section(
+    def _render_section_into(
+        buf: list[str],
         section: str,
         model,
         *,
         placeholders: dict[str, str] | None = None,
         extra_comments: list[str] | None = None,
-    ) -> str:
-        lines: list[str] = []
+    ) -> None:
+        """Append a blank separator line followed by the rendered section to ``buf``."""
+        buf.append("")
         if extra_comments:
-            lines.extend([f"# {c}" for c in extra_comments])
-        lines.append(f"[{section}]")
+            buf.extend(f"# {c}" for c in extra_comments)
+        buf.append(f"[{section}]")
 
         placeholders = placeholders or {}
 
-        for field_name, field in model.model_fields.items():
-            key = field.alias or field_name
-            value = placeholders.get(key, _placeholder_for_field(field))
-            if field.description:
-                lines.append(f"# {field.description}")
-            lines.append(f"{key} = {value}")
-            lines.append("")
-
-        if lines and lines[-1] == "":
-            lines.pop()
-        return "\n".join(lines)
+        for index, (key, description, placeholder) in enumerate(_model_schema(model)):
+            if index:
+                buf.append("")
+            if description:
+                buf.append(f"# {description}")
+            buf.append(f"{key} = {placeholders.get(key, placeholder)}")
 
-    dest_path = Path(destination or DEFAULT_CONFIG_PATH).expanduser()
+    dest_path = Path(destination).expanduser() if destination else DEFAULT_CONFIG_PATH
     dest_path.parent.mkdir(parents=True, exist_ok=True)
     if dest_path.exists() and not force:
         raise FileExistsError(f"Config file already exists at {dest_path}. Use --force to overwrite.")
 
-    sections = [
-        "# Generated from OpenSandbox config schema. Remove sections you do not use.",
-        _render_section("server", ServerConfig),
-        _render_section("runtime", RuntimeConfig),
-        _render_section("docker", DockerConfig),
-        _render_section(
-            "egress",
-            EgressConfig,
-            extra_comments=["Used when networkPolicy is provided. Requires docker.network_mode = \"bridge\"."],
-        ),
-        _render_section(
-            "kubernetes",
-            KubernetesRuntimeConfig,
-            extra_comments=["Only used when runtime.type = \"kubernetes\""],
-        ),
-        _render_section(
-            "agent_sandbox",
-            AgentSandboxRuntimeConfig,
-            extra_comments=["Requires kubernetes.workload_provider = \"agent-sandbox\""],
-        ),
-        _render_section(
-            "router",
-            RouterConfig,
-            placeholders={"domain": '""', "wildcard-domain": '""'},
-            extra_comments=["Set exactly one of domain or wildcard-domain."],
-        ),
-    ]
+    buf = ["# Generated from OpenSandbox config schema. Remove sections you do not use."]
+    _render_section_into(buf, "server", ServerConfig)
+    _render_section_into(buf, "runtime", RuntimeConfig)
+    _render_section_into(buf, "docker", DockerConfig)
+    _render_section_into(
+        buf,
+        "egress",
+        EgressConfig,
+        extra_comments=["Used when networkPolicy is provided. Requires docker.network_mode = \"bridge\"."],
+    )
+    _render_section_into(
+        buf,
+        "kubernetes",
+        KubernetesRuntimeConfig,
+        extra_comments=["Only used when runtime.type = \"kubernetes\""],
+    )
+    _render_section_into(
+        buf,
+        "agent_sandbox",
+        AgentSandboxRuntimeConfig,
+        extra_comments=["Requires kubernetes.workload_provider = \"agent-sandbox\""],
+    )
+    _render_section_into(
+        buf,
+        "router",
+        RouterConfig,
+        placeholders={"domain": '""', "wildcard-domain": '""'},
+        extra_comments=["Set exactly one of domain or wildcard-domain."],
+    )
 
-    content = "\n\n".join(sections) + "\n"
-    dest_path.write_text(content, encoding="utf-8")
+    content = "\n".join(buf) + "\n"
+    _write_atomic(dest_path, content.encode("utf-8"))
     return dest_path
 
 
@@ -216,14 +258,22 @@ def main() -> None:
     if args.config:
         os.environ[CONFIG_ENV_VAR] = args.config
 
-    from src import main as server_main  # local import after env is set
+    import uvicorn
+
+    from src.config import load_config  # local import after env is set
+    from src.logging_config import build_log_config
+
+    # Only the config is needed here; uvicorn imports src.main itself (once per
+    # worker under --reload), so the app is never initialized in this process
+    # just to read host/port.
+    app_config = load_config()
 
     uvicorn.run(
         "src.main:app",
-        host=server_main.app_config.server.host,
-        port=server_main.app_config.server.port,
+        host=app_config.server.host,
+        port=app_config.server.port,
         reload=args.reload,
-        log_config=server_main._log_config,
+        log_config=build_log_config(app_config.server.log_level),
     )
 
 
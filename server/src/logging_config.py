@@ -0,0 +1,52 @@
+# Copyright 2026 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Logging configuration shared by the FastAPI app and the CLI launcher.
+
+Kept separate from ``src.main`` so the CLI can hand uvicorn a log config
+without importing (and fully initializing) the application module.
+"""
+
+import copy
+from typing import Any
+
+from uvicorn.config import LOGGING_CONFIG as UVICORN_LOGGING_CONFIG
+
+_FMT = "%(levelprefix)s %(asctime)s %(name)s: %(message)s"
+_DATEFMT = "%Y-%m-%d %H:%M:%S%z"
+
+
+def build_log_config(log_level: str) -> dict[str, Any]:
+    """
+    Build a uvicorn-compatible logging dict config.
+
+    Unifies the format of uvicorn access/error logs with a timestamp prefix and
+    routes project loggers (``src.*``) through the default handler at
+    ``log_level``.
+    """
+    log_config = copy.deepcopy(UVICORN_LOGGING_CONFIG)
+
+    # Enable colors and set format for both default and access loggers
+    for formatter in ("default", "access"):
+        log_config["formatters"][formatter]["fmt"] = _FMT
+        log_config["formatters"][formatter]["datefmt"] = _DATEFMT
+        log_config["formatters"][formatter]["use_colors"] = True
+
+    log_config["loggers"]["src"] = {
+        "handlers": ["default"],
+        "level": log_level.upper(),
+        "propagate": False,
+    }
+    return log_config
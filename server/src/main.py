@@ -19,7 +19,6 @@ This module initializes the FastAPI application with middleware, routes,
 and configuration for the sandbox lifecycle management service.
 """
 
-import copy
 import logging.config
 from typing import Any
 
@@ -28,32 +27,15 @@ from fastapi.exceptions import HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
-from src.config import load_config
-from uvicorn.config import LOGGING_CONFIG as UVICORN_LOGGING_CONFIG
+from src.config import get_config
+from src.logging_config import build_log_config
 
-# Load configuration before initializing routers/middleware
-app_config = load_config()
+# Load configuration before initializing routers/middleware. Reuses the config
+# already loaded by the CLI launcher when running in the same process.
+app_config = get_config()
 
 # Unify logging format (including uvicorn access/error logs) with timestamp prefix.
-_log_config = copy.deepcopy(UVICORN_LOGGING_CONFIG)
-_fmt = "%(levelprefix)s %(asctime)s %(name)s: %(message)s"
-_datefmt = "%Y-%m-%d %H:%M:%S%z"
-
-# Enable colors and set format for both default and access loggers
-_log_config["formatters"]["default"]["fmt"] = _fmt
-_log_config["formatters"]["default"]["datefmt"] = _datefmt
-_log_config["formatters"]["default"]["use_colors"] = True
-
-_log_config["formatters"]["access"]["fmt"] = _fmt
-_log_config["formatters"]["access"]["datefmt"] = _datefmt
-_log_config["formatters"]["access"]["use_colors"] = True
-
-# Ensure project loggers (src.*) emit at configured level using the default handler.
-_log_config["loggers"]["src"] = {
-    "handlers": ["default"],
-    "level": app_config.server.log_level.upper(),
-    "propagate": False,
-}
+_log_config = build_log_config(app_config.server.log_level)
 
 logging.config.dictConfig(_log_config)
 logging.getLogger().setLevel(
@@ -0,0 +1,190 @@
+# Copyright 2026 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import stat
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+import uvicorn
+
+from src import cli
+from src import config as config_module
+from src.config import CONFIG_ENV_VAR
+from src.logging_config import build_log_config
+
+SERVER_ROOT = Path(cli.__file__).resolve().parent.parent
+
+
+def test_copy_example_config_writes_packaged_example(tmp_path):
+    dest = tmp_path / "nested" / "sandbox.toml"
+
+    written = cli.copy_example_config(dest, kind="docker")
+
+    assert written == dest
+    expected = (SERVER_ROOT / "example.config.toml").read_text(encoding="utf-8")
+    assert dest.read_text(encoding="utf-8") == expected
+
+
+def test_copy_example_config_rejects_unknown_kind(tmp_path):
+    with pytest.raises(ValueError):
+        cli.copy_example_config(tmp_path / "sandbox.toml", kind="unknown")
+
+
+def test_copy_example_config_requires_force_to_overwrite(tmp_path):
+    dest = tmp_path / "sandbox.toml"
+    dest.write_text("existing", encoding="utf-8")
+
+    with pytest.raises(FileExistsError):
+        cli.copy_example_config(dest, kind="docker")
+    assert dest.read_text(encoding="utf-8") == "existing"
+
+    cli.copy_example_config(dest, kind="docker", force=True)
+    assert dest.read_text(encoding="utf-8") != "existing"
+
+
+def test_render_full_config_emits_all_sections(tmp_path):
+    dest = tmp_path / "sandbox.toml"
+
+    cli.render_full_config(dest)
+
+    content = dest.read_text(encoding="utf-8")
+    assert content.startswith("# Generated from OpenSandbox config schema.")
+    assert content.endswith("\n") and not content.endswith("\n\n")
+    for section in (
+        "server",
+        "runtime",
+        "docker",
+        "egress",
+        "kubernetes",
+        "agent_sandbox",
+        "router",
+    ):
+        assert f"\n[{section}]\n" in content
+    assert '\ndomain = ""\n' in content
+    assert '\nwildcard-domain = ""\n' in content
+
+
+def test_render_full_config_requires_force_to_overwrite(tmp_path):
+    dest = tmp_path / "sandbox.toml"
+    dest.write_text("existing", encoding="utf-8")
+
+    with pytest.raises(FileExistsError):
+        cli.render_full_config(dest)
+
+    cli.render_full_config(dest, force=True)
+    assert dest.read_text(encoding="utf-8").startswith("# Generated")
+
+
+def test_render_full_config_leaves_no_temp_file(tmp_path):
+    dest = tmp_path / "sandbox.toml"
+
+    cli.render_full_config(dest)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["sandbox.toml"]
+
+
+def test_render_full_config_preserves_existing_mode(tmp_path):
+    dest = tmp_path / "sandbox.toml"
+    dest.write_text("existing", encoding="utf-8")
+    dest.chmod(0o600)
+
+    cli.render_full_config(dest, force=True)
+
+    assert stat.S_IMODE(dest.stat().st_mode) == 0o600
+
+
+def test_render_full_config_new_file_honors_umask(tmp_path):
+    dest = tmp_path / "sandbox.toml"
+    umask = os.umask(0o027)
+    try:
+        cli.render_full_config(dest)
+    finally:
+        os.umask(umask)
+
+    assert stat.S_IMODE(dest.stat().st_mode) == 0o640
+
+
+def test_copy_example_config_writes_through_symlink(tmp_path):
+    target = tmp_path / "dotfiles" / "sandbox.toml"
+    target.parent.mkdir()
+    target.write_text("existing", encoding="utf-8")
+    link = tmp_path / "sandbox.toml"
+    link.symlink_to(target)
+
+    cli.copy_example_config(link, kind="docker", force=True)
+
+    assert link.is_symlink()
+    expected = (SERVER_ROOT / "example.config.toml").read_text(encoding="utf-8")
+    assert target.read_text(encoding="utf-8") == expected
+
+
+def test_render_full_config_cleans_up_temp_file_on_failure(tmp_path, monkeypatch):
+    dest = tmp_path / "sandbox.toml"
+    dest.write_text("existing", encoding="utf-8")
+
+    def _fail_replace(src, dst):
+        raise OSError("replace failed")
+
+    monkeypatch.setattr(cli.os, "replace", _fail_replace)
+
+    with pytest.raises(OSError, match="replace failed"):
+        cli.render_full_config(dest, force=True)
+
+    assert dest.read_text(encoding="utf-8") == "existing"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["sandbox.toml"]
+
+
+def test_main_runs_uvicorn_from_loaded_config_without_importing_app(tmp_path, monkeypatch):
+    config_path = tmp_path / "config.toml"
+    config_path.write_text(
+        textwrap.dedent(
+            """
+            [server]
+            host = "0.0.0.0"
+            port = 9100
+            log_level = "WARNING"
+
+            [runtime]
+            type = "docker"
+            execd_image = "ghcr.io/opensandbox/platform:test"
+            """
+        )
+    )
+    monkeypatch.setattr(config_module, "_config", None, raising=False)
+    monkeypatch.setattr(config_module, "_config_path", None, raising=False)
+    monkeypatch.setenv(CONFIG_ENV_VAR, "unused")
+    monkeypatch.delitem(sys.modules, "src.main", raising=False)
+    monkeypatch.setattr(sys, "argv", ["opensandbox-server", "--config", str(config_path)])
+
+    calls = []
+    monkeypatch.setattr(uvicorn, "run", lambda app, **kwargs: calls.append((app, kwargs)))
+
+    cli.main()
+
+    assert os.environ[CONFIG_ENV_VAR] == str(config_path)
+    assert calls == [
+        (
+            "src.main:app",
+            {
+                "host": "0.0.0.0",
+                "port": 9100,
+                "reload": False,
+                "log_config": build_log_config("WARNING"),
+            },
+        )
+    ]
+    assert "src.main" not in sys.modules
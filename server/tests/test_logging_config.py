@@ -0,0 +1,47 @@
+# Copyright 2026 Alibaba Group Holding Ltd.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from uvicorn.config import LOGGING_CONFIG as UVICORN_LOGGING_CONFIG
+
+from src.logging_config import build_log_config
+
+
+def test_build_log_config_formats_uvicorn_loggers():
+    log_config = build_log_config("info")
+
+    for formatter in ("default", "access"):
+        assert log_config["formatters"][formatter]["fmt"] == (
+            "%(levelprefix)s %(asctime)s %(name)s: %(message)s"
+        )
+        assert log_config["formatters"][formatter]["datefmt"] == "%Y-%m-%d %H:%M:%S%z"
+        assert log_config["formatters"][formatter]["use_colors"] is True
+
+
+def test_build_log_config_routes_project_loggers_at_level():
+    log_config = build_log_config("debug")
+
+    assert log_config["loggers"]["src"] == {
+        "handlers": ["default"],
+        "level": "DEBUG",
+        "propagate": False,
+    }
+
+
+def test_build_log_config_does_not_mutate_uvicorn_defaults():
+    build_log_config("debug")
+
+    assert "src" not in UVICORN_LOGGING_CONFIG["loggers"]
+    assert UVICORN_LOGGING_CONFIG["formatters"]["default"]["fmt"] != (
+        "%(levelprefix)s %(asctime)s %(name)s: %(message)s"
+    )